@@ -164,13 +164,13 @@ print()
 print("📝 Example 8: Error comparison")
 print("-" * 70)
 
-test_cases = [
+test_cases = (
     ("Missing variable", "print(x)"),
     ("Wrong type", "'hello' + 5"),
     ("Index error", "[1,2,3][99]"),
     ("Key error", "{'a':1}['b']"),
     ("Division by zero", "10 / 0"),
-]
+)
 
 for name, code in test_cases:
     result = pydefine.safe_run(code)
@@ -87,12 +87,12 @@ print()
 print("📝 Example 6: Comparing different errors")
 print("-" * 70)
 
-errors_to_test = [
+errors_to_test = (
     ("1 / 0", "ZeroDivisionError"),
     ("int('abc')", "ValueError"),
     ("[1,2,3][10]", "IndexError"),
     ("undefined", "NameError"),
-]
+)
 
 for code, expected in errors_to_test:
     try:
@@ -18,29 +18,79 @@ https://github.com/mdyahhya/pydefine
 :license: MIT, see LICENSE for more details.
 """
 
+import importlib
 import sys
+from typing import TYPE_CHECKING
 
 from .version import __version__
-from .core import (
-    decode_traceback, decode_exception, safe_run, decode_traceback_file, 
-    explain, quick_decode
-)
-from .mapping import (
-    get_exception_info, EXCEPTION_MAP, list_all_exceptions, 
-    search_exceptions_by_tag, TOTAL_EXCEPTIONS, ALL_TAGS
-)
-from .utils import (
-    extract_error_info, format_output, tokenize_output, strip_ansi_codes,
-    get_python_version, get_error_category, clean_traceback_text
-)
-from .cli import main as cli_main
-from .i18n import translate_explanation, set_language, get_language, SUPPORTED_LANGUAGES
+
+if TYPE_CHECKING:
+    # Real imports for type checkers and IDEs; at runtime the same names are
+    # resolved on first access by __getattr__ below
+    from . import cli, core, i18n, mapping, utils
+    from .core import (
+        decode_traceback, decode_exception, decode_many, decode_exception_name, safe_run,
+        decode_traceback_file, explain, quick_decode
+    )
+    from .mapping import (
+        get_exception_info, EXCEPTION_MAP, list_all_exceptions,
+        search_exceptions_by_tag, TOTAL_EXCEPTIONS, ALL_TAGS
+    )
+    from .utils import (
+        extract_error_info, format_output, tokenize_output, strip_ansi_codes,
+        get_python_version, get_error_category, clean_traceback_text, show_branding
+    )
+    from .cli import main as cli_main
+    from .i18n import translate_explanation, set_language, get_language, SUPPORTED_LANGUAGES
+
+# Submodules, reachable as attributes (pydefine.core) like before they were lazy
+_SUBMODULES = frozenset({"cli", "core", "i18n", "mapping", "utils"})
+
+# Public names and the submodule that provides them. Submodules are only
+# imported the first time one of their names is accessed (PEP 562), so
+# `import pydefine` stays cheap for callers that need a single function.
+_LAZY_ATTRS = {
+    # Core functions
+    "decode_traceback": ("core", "decode_traceback"),
+    "decode_exception": ("core", "decode_exception"),
+    "decode_many": ("core", "decode_many"),
+    "decode_exception_name": ("core", "decode_exception_name"),
+    "safe_run": ("core", "safe_run"),
+    "decode_traceback_file": ("core", "decode_traceback_file"),
+    "explain": ("core", "explain"),
+    "quick_decode": ("core", "quick_decode"),
+    # Mapping
+    "get_exception_info": ("mapping", "get_exception_info"),
+    "EXCEPTION_MAP": ("mapping", "EXCEPTION_MAP"),
+    "list_all_exceptions": ("mapping", "list_all_exceptions"),
+    "search_exceptions_by_tag": ("mapping", "search_exceptions_by_tag"),
+    "TOTAL_EXCEPTIONS": ("mapping", "TOTAL_EXCEPTIONS"),
+    "ALL_TAGS": ("mapping", "ALL_TAGS"),
+    # Utilities
+    "extract_error_info": ("utils", "extract_error_info"),
+    "format_output": ("utils", "format_output"),
+    "tokenize_output": ("utils", "tokenize_output"),
+    "strip_ansi_codes": ("utils", "strip_ansi_codes"),
+    "get_python_version": ("utils", "get_python_version"),
+    "get_error_category": ("utils", "get_error_category"),
+    "clean_traceback_text": ("utils", "clean_traceback_text"),
+    "show_branding": ("utils", "show_branding"),
+    # CLI
+    "cli_main": ("cli", "main"),
+    # i18n
+    "translate_explanation": ("i18n", "translate_explanation"),
+    "set_language": ("i18n", "set_language"),
+    "get_language": ("i18n", "get_language"),
+    "SUPPORTED_LANGUAGES": ("i18n", "SUPPORTED_LANGUAGES"),
+}
 
 __all__ = [
     "__version__",
     # Core functions
     "decode_traceback",
     "decode_exception",
+    "decode_many",
+    "decode_exception_name",
     "safe_run",
     "decode_traceback_file",
     "explain",
@@ -60,6 +110,7 @@ __all__ = [
     "get_python_version",
     "get_error_category",
     "clean_traceback_text",
+    "show_branding",
     # CLI
     "cli_main",
     # i18n
@@ -69,6 +120,25 @@ __all__ = [
     "SUPPORTED_LANGUAGES",
 ]
 
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # Importing a submodule also binds it on the package
+        return importlib.import_module(f"{__name__}.{name}")
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    # Cache on the package so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _SUBMODULES)
+
+
 # Automatically install global exception hook on import
 def _global_exception_hook(exc_type, exc_value, exc_traceback):
     try:
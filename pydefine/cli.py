@@ -14,12 +14,19 @@ Usage:
 
 import sys
 import argparse
+import functools
 from pathlib import Path
 from typing import Optional
 
 from .core import safe_run, decode_traceback_file, decode_exception
 from .version import __version__, LIBRARY_NAME
 from .mapping import list_all_exceptions, search_exceptions_by_tag, TOTAL_EXCEPTIONS
+from .utils import get_error_category
+
+# Separators and footer shared by every report
+_SEP = "─" * 70
+_EQ = "=" * 70
+_FOOTER = f"\n Powered by {LIBRARY_NAME}"
 
 
 def run_file(filepath: str, verbose: bool = False) -> int:
@@ -37,85 +44,92 @@ def run_file(filepath: str, verbose: bool = False) -> int:
     
     if not file_path.exists():
         print(f"❌ Error: File '{filepath}' not found")
-        print(f"\n Powered by {LIBRARY_NAME}")
+        print(_FOOTER)
         return 1
     
     if not file_path.suffix == '.py':
         print(f"⚠️  Warning: File '{filepath}' doesn't have .py extension")
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            code = f.read()
+        # compile() copes with any newline style, so skip the text layer
+        code = file_path.read_bytes().decode('utf-8')
     except Exception as e:
         print(f"❌ Error reading file: {e}")
-        print(f"\n Powered by {LIBRARY_NAME}")
+        print(_FOOTER)
         return 1
     
     print(f"🚀 Running: {filepath}")
-    print("─" * 70)
+    print(_SEP)
     
     # Run the code
     result = safe_run(code, filename=str(file_path))
     
+    # Collect the report and write it in one go rather than line by line
+    lines = []
     if result['success']:
         # Success
-        if result.get('output'):
-            print(result['output'], end='')
-        print("\n" + "─" * 70)
-        print("✅ Code executed successfully!")
+        lines.append("\n" + _SEP)
+        lines.append("✅ Code executed successfully!")
         if verbose:
-            print(f"📊 Exit code: 0")
-        print(f"\n Powered by {LIBRARY_NAME}")
+            lines.append(f"📊 Exit code: 0")
+        lines.append(_FOOTER)
+        sys.stdout.write(result.get('output', '') + "\n".join(lines) + "\n")
         return 0
     else:
         # Error occurred
-        if result.get('output'):
-            print(result['output'], end='')
-        
-        print("\n" + "=" * 70)
-        print(f"❌ ERROR DETECTED")
-        print("=" * 70)
-        print()
+        lines.append("\n" + _EQ)
+        lines.append(f"❌ ERROR DETECTED")
+        lines.append(_EQ)
+        lines.append("")
         
         # Print decoded error
         emoji = result.get('emoji', '❓')
         error_type = result.get('error_type', 'UnknownError')
         original_msg = result.get('original_message', '')
         
-        print(f"{emoji} {error_type}")
+        lines.append(f"{emoji} {error_type}")
         if original_msg:
-            print(f"   Original message: {original_msg}")
-        print()
+            lines.append(f"   Original message: {original_msg}")
+        lines.append("")
         
-        print("📖 What happened:")
+        lines.append("📖 What happened:")
         explanation = result.get('simple_explanation', 'No explanation available')
-        for line in explanation.split('. '):
-            if line.strip():
-                print(f"   • {line.strip()}.")
-        print()
+        lines.extend(_explanation_bullets(explanation))
+        lines.append("")
         
-        print("💡 How to fix:")
+        lines.append("💡 How to fix:")
         fix = result.get('fix_suggestion', 'No suggestion available')
-        print(f"   {fix}")
-        print()
+        lines.append(f"   {fix}")
+        lines.append("")
         
         if result.get('line_number') or result.get('file_name'):
-            print("📍 Error location:")
+            lines.append("📍 Error location:")
             if result.get('file_name'):
-                print(f"   File: {result['file_name']}")
+                lines.append(f"   File: {result['file_name']}")
             if result.get('line_number'):
-                print(f"   Line: {result['line_number']}")
-            print()
+                lines.append(f"   Line: {result['line_number']}")
+            lines.append("")
         
         if verbose and result.get('tags'):
-            print(f"🏷️  Tags: {', '.join(result['tags'])}")
-            print()
+            lines.append(f"🏷️  Tags: {', '.join(result['tags'])}")
+            lines.append("")
         
-        print("─" * 70)
-        print(f"\n Powered by {LIBRARY_NAME}")
+        lines.append(_SEP)
+        lines.append(_FOOTER)
+        sys.stdout.write(result.get('output', '') + "\n".join(lines) + "\n")
         return 1
 
 
+@functools.lru_cache(maxsize=128)
+def _explanation_bullets(explanation: str) -> tuple:
+    """Split an explanation into '   • sentence.' lines (explanations are static, so cache)."""
+    return tuple(
+        f"   • {line.strip()}."
+        for line in explanation.split('. ')
+        if line.strip()
+    )
+
+
 def list_exceptions_command(tag: Optional[str] = None) -> int:
     """
     List all supported exceptions.
@@ -126,61 +140,52 @@ def list_exceptions_command(tag: Optional[str] = None) -> int:
     Returns:
         Exit code (always 0)
     """
-    print(f"📚 {LIBRARY_NAME} - Supported Exceptions")
-    print("=" * 70)
+    lines = [f"📚 {LIBRARY_NAME} - Supported Exceptions", _EQ]
     
     if tag:
         exceptions = search_exceptions_by_tag(tag)
-        print(f"\n🏷️  Exceptions with tag '{tag}': {len(exceptions)}")
-        print()
+        lines.append(f"\n🏷️  Exceptions with tag '{tag}': {len(exceptions)}")
+        lines.append("")
         for exc in exceptions:
-            print(f"  • {exc}")
+            lines.append(f"  • {exc}")
     else:
-        exceptions = list_all_exceptions()
-        print(f"\n✅ Total exceptions supported: {TOTAL_EXCEPTIONS}")
-        print()
-        print("Common exceptions:")
+        lines.append(f"\n✅ Total exceptions supported: {TOTAL_EXCEPTIONS}")
+        lines.append("")
+        lines.append("Common exceptions:")
         common = [
             'SyntaxError', 'IndentationError', 'NameError', 'TypeError',
             'ValueError', 'KeyError', 'IndexError', 'ZeroDivisionError',
             'AttributeError', 'FileNotFoundError', 'ImportError', 'ModuleNotFoundError'
         ]
         for exc in common:
-            print(f"  • {exc}")
+            lines.append(f"  • {exc}")
         
-        print(f"\n... and {TOTAL_EXCEPTIONS - len(common)} more!")
-        print("\nUse --list-all to see complete list")
+        lines.append(f"\n... and {TOTAL_EXCEPTIONS - len(common)} more!")
+        lines.append("\nUse --list-all to see complete list")
     
-    print(f"\n Powered by {LIBRARY_NAME}")
+    lines.append(_FOOTER)
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
 def list_all_exceptions_command() -> int:
     """List all exceptions in detail."""
-    print(f"📚 {LIBRARY_NAME} - All Supported Exceptions")
-    print("=" * 70)
-    print()
-    
-    exceptions = list_all_exceptions()
-    
-    # Group by category
-    from .utils import get_error_category
+    lines = [f"📚 {LIBRARY_NAME} - All Supported Exceptions", _EQ, ""]
     
+    # Group by category; list_all_exceptions() is already sorted
     categories = {}
-    for exc in exceptions:
-        cat = get_error_category(exc)
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(exc)
+    for exc in list_all_exceptions():
+        categories.setdefault(get_error_category(exc), []).append(exc)
     
     for category, exc_list in sorted(categories.items()):
-        print(f"📂 {category} ({len(exc_list)} exceptions)")
-        for exc in sorted(exc_list):
-            print(f"   • {exc}")
-        print()
+        lines.append(f"📂 {category} ({len(exc_list)} exceptions)")
+        for exc in exc_list:
+            lines.append(f"   • {exc}")
+        lines.append("")
     
-    print(f"✅ Total: {TOTAL_EXCEPTIONS} exceptions")
-    print(f"\n Powered by {LIBRARY_NAME}")
+    lines.append(f"✅ Total: {TOTAL_EXCEPTIONS} exceptions")
+    lines.append(_FOOTER)
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
@@ -195,7 +200,7 @@ def decode_log_command(filepath: str) -> int:
         Exit code
     """
     print(f"📖 Decoding traceback from: {filepath}")
-    print("─" * 70)
+    print(_SEP)
     
     result = decode_traceback_file(filepath)
     
@@ -276,7 +281,7 @@ def main():
     
     # No file provided, show help
     parser.print_help()
-    print(f"\n Powered by {LIBRARY_NAME}")
+    print(_FOOTER)
     return 0
 
 
@@ -7,23 +7,37 @@ Core functionality for pyDefine library.
 This module provides the main API functions:
   - decode_traceback(traceback_text): Parse and decode a traceback string
   - decode_exception(e): Decode an exception object directly
+  - decode_many(traceback_texts): Decode a batch of traceback strings
+  - decode_exception_name(name, message): Decode from an exception's class name
   - safe_run(code, filename): Execute code safely with error decoding
 
 All functions return structured dictionaries with error information,
 simple explanations, and fix suggestions.
 """
 
-import sys
-import traceback
-import re
-from typing import Dict, Any, Optional, Union
+import ast
+import contextlib
+import functools
+import io
+import os
+from typing import Dict, Any, Iterable, List, Optional, Union
 
-from .mapping import get_exception_info
-from .utils import extract_error_info, format_output, tokenize_output
+from .mapping import get_exception_info, resolve_exception_name
+from .utils import extract_error_info, format_output, tokenize_output, _maybe_show_branding
 from .i18n import translate_explanation, get_language
 
+# Branding line attached to every result dict
+_BRANDING = "Powered by pyDefine"
 
-def decode_traceback(traceback_text: str) -> Dict[str, Any]:
+# Longer inputs (traceback texts, files, error messages, safe_run code) bypass
+# the caches, so a few huge ones can't stay pinned for the life of the process
+_MAX_CACHED_TEXT = 16 * 1024
+
+
+def decode_traceback(
+    traceback_text: str, *, include_formatted: bool = True, include_tokens: bool = True
+) -> Dict[str, Any]:
+    _maybe_show_branding()
     if not traceback_text or not isinstance(traceback_text, str):
         return {
             "error_type": "InvalidInput",
@@ -35,34 +49,49 @@ def decode_traceback(traceback_text: str) -> Dict[str, Any]:
             "tags": ["invalid-input"],
             "emoji": "❓",
             "success": False,
-            "branding": "Powered by pyDefine"
+            "branding": _BRANDING
         }
-    error_info = extract_error_info(traceback_text)
-    exception_data = get_exception_info(error_info["error_type"])
-    result = {
-        "error_type": error_info["error_type"],
-        "original_message": error_info["original_message"],
-        "simple_explanation": exception_data["simple_explanation"],
-        "fix_suggestion": exception_data["fix_suggestion"],
-        "line_number": error_info.get("line_number"),
-        "file_name": error_info.get("file_name"),
-        "tags": exception_data.get("tags", []),
-        "emoji": exception_data.get("emoji", "❓"),
-        "success": False
-    }
-    current_lang = get_language()
-    if current_lang != "en":
-        result["translated_explanation"] = translate_explanation(
-            result["simple_explanation"],
-            current_lang
+    if len(traceback_text) <= _MAX_CACHED_TEXT:
+        parsed = _parse_traceback(traceback_text)
+    else:
+        parsed = _parse_traceback.__wrapped__(traceback_text)
+    return _decode_fields(
+        *parsed,
+        include_formatted=include_formatted,
+        include_tokens=include_tokens,
+    )
+
+
+def decode_many(
+    traceback_texts: Iterable[str], *, include_formatted: bool = True, include_tokens: bool = True
+) -> List[Dict[str, Any]]:
+    # Batches (CI logs, IDE problem lists) tend to repeat the same tracebacks,
+    # which are parsed and built once through the caches below
+    return [
+        decode_traceback(
+            text, include_formatted=include_formatted, include_tokens=include_tokens
         )
-    result["formatted_output"] = format_output(result)
-    result["tokens"] = tokenize_output(result)
-    result["branding"] = "Powered by pyDefine"
-    return result
+        for text in traceback_texts
+    ]
+
 
+@functools.lru_cache(maxsize=512)
+def _parse_traceback(traceback_text: str) -> tuple:
+    # Log replays feed the same traceback text again and again; parse it once.
+    # Frames are never part of a result, so only the error location is scanned
+    error_info = extract_error_info(traceback_text, collect_frames=False)
+    return (
+        error_info["error_type"],
+        error_info["original_message"],
+        error_info.get("line_number"),
+        error_info.get("file_name"),
+    )
 
-def decode_exception(e: Exception) -> Dict[str, Any]:
+
+def decode_exception(
+    e: Exception, *, include_formatted: bool = True, include_tokens: bool = True
+) -> Dict[str, Any]:
+    _maybe_show_branding()
     if not isinstance(e, BaseException):
         return {
             "error_type": "InvalidInput",
@@ -74,19 +103,107 @@ def decode_exception(e: Exception) -> Dict[str, Any]:
             "tags": ["invalid-input"],
             "emoji": "❓",
             "success": False,
-            "branding": "Powered by pyDefine"
+            "branding": _BRANDING
         }
     error_type = type(e).__name__
     original_message = str(e)
     line_number = None
     file_name = None
-    if hasattr(e, '__traceback__') and e.__traceback__ is not None:
-        tb = e.__traceback__
+    # Every BaseException has __traceback__; it is None if never raised
+    tb = e.__traceback__
+    if tb is not None:
         while tb.tb_next is not None:
             tb = tb.tb_next
         line_number = tb.tb_lineno
         file_name = tb.tb_frame.f_code.co_filename
-    exception_data = get_exception_info(error_type)
+    if isinstance(e, SyntaxError) and e.filename is not None:
+        # Syntax errors carry the location of the bad code itself; the
+        # traceback only points at the compile() call that raised them
+        original_message = e.msg or original_message
+        line_number = e.lineno
+        file_name = e.filename
+    return _decode_fields(
+        error_type, original_message, line_number, file_name,
+        mapped_name=resolve_exception_name(type(e)),
+        include_formatted=include_formatted,
+        include_tokens=include_tokens,
+    )
+
+
+def decode_exception_name(
+    name: str,
+    message: str = "",
+    file_name: Optional[str] = None,
+    line_number: Optional[int] = None,
+    *,
+    include_formatted: bool = True,
+    include_tokens: bool = True,
+) -> Dict[str, Any]:
+    # For callers that only hold the class name and message (log records,
+    # API error payloads): no exception is raised and no traceback is walked
+    _maybe_show_branding()
+    if not name or not isinstance(name, str):
+        return {
+            "error_type": "InvalidInput",
+            "original_message": "No exception name provided",
+            "simple_explanation": "No error information was provided to decode.",
+            "fix_suggestion": "Pass an exception class name such as 'KeyError'",
+            "line_number": None,
+            "file_name": None,
+            "tags": ["invalid-input"],
+            "emoji": "❓",
+            "success": False,
+            "branding": _BRANDING
+        }
+    return _decode_fields(
+        name, message, line_number, file_name,
+        include_formatted=include_formatted,
+        include_tokens=include_tokens,
+    )
+
+
+def _decode_fields(
+    error_type: str,
+    original_message: str,
+    line_number: Optional[int],
+    file_name: Optional[str],
+    mapped_name: Optional[str] = None,
+    include_formatted: bool = True,
+    include_tokens: bool = True,
+) -> Dict[str, Any]:
+    # Hand out a copy so callers can add or change keys without touching the cache.
+    # Nested values are stored immutably there, so each caller gets its own lists
+    if original_message and len(original_message) > _MAX_CACHED_TEXT:
+        build = _build_result.__wrapped__
+    else:
+        build = _build_result
+    result = dict(build(
+        error_type, original_message, line_number, file_name,
+        mapped_name or error_type, get_language(), include_formatted, include_tokens
+    ))
+    tags = list(result["tags"])
+    result["tags"] = tags
+    if include_tokens:
+        result["tokens"] = [
+            {"type": "tags", "content": tags} if token["type"] == "tags" else dict(token)
+            for token in result["tokens"]
+        ]
+    return result
+
+
+@functools.lru_cache(maxsize=512)
+def _build_result(
+    error_type: str,
+    original_message: str,
+    line_number: Optional[int],
+    file_name: Optional[str],
+    mapped_name: str,
+    language: str,
+    include_formatted: bool,
+    include_tokens: bool,
+) -> Dict[str, Any]:
+    # Results only depend on these fields, so repeated errors are built once
+    exception_data = get_exception_info(mapped_name)
     result = {
         "error_type": error_type,
         "original_message": original_message,
@@ -94,22 +211,57 @@ def decode_exception(e: Exception) -> Dict[str, Any]:
         "fix_suggestion": exception_data["fix_suggestion"],
         "line_number": line_number,
         "file_name": file_name,
-        "tags": exception_data.get("tags", []),
+        "tags": tuple(exception_data.get("tags", ())),
         "emoji": exception_data.get("emoji", "❓"),
         "success": False
     }
-    current_lang = get_language()
-    if current_lang != "en":
+    if language != "en":
         result["translated_explanation"] = translate_explanation(
             result["simple_explanation"],
-            current_lang
+            language
         )
-    result["formatted_output"] = format_output(result)
-    result["tokens"] = tokenize_output(result)
-    result["branding"] = "Powered by pyDefine"
+    if include_formatted:
+        result["formatted_output"] = format_output(result)
+    if include_tokens:
+        result["tokens"] = tuple(tokenize_output(result))
+    result["branding"] = _BRANDING
     return result
 
-def safe_run(code: str, filename: str = "<input>", globals_dict: Optional[Dict] = None, locals_dict: Optional[Dict] = None) -> Dict[str, Any]:
+
+# Builtins exposed to code run through safe_run() with no globals_dict
+_SAFE_BUILTINS = {
+    "print": print,
+    "len": len,
+    "range": range,
+    "int": int,
+    "float": float,
+    "str": str,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+    "tuple": tuple,
+    "set": set,
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "sum": sum,
+    "sorted": sorted,
+    "reversed": reversed,
+    "enumerate": enumerate,
+    "zip": zip,
+    "map": map,
+    "filter": filter,
+    "round": round,
+    "pow": pow,
+    "isinstance": isinstance,
+    "type": type,
+    "dir": dir,
+    "help": help,
+}
+
+
+def safe_run(code: str, filename: str = "<input>", globals_dict: Optional[Dict] = None, locals_dict: Optional[Dict] = None, capture_output: bool = True) -> Dict[str, Any]:
+    _maybe_show_branding()
     if not isinstance(code, str):
         return {
             "success": False,
@@ -119,7 +271,7 @@ def safe_run(code: str, filename: str = "<input>", globals_dict: Optional[Dict]
             "fix_suggestion": "Pass a string containing Python code",
             "tags": ["invalid-input"],
             "emoji": "❓",
-            "branding": "Powered by pyDefine"
+            "branding": _BRANDING
         }
     
     if not code.strip():
@@ -128,40 +280,13 @@ def safe_run(code: str, filename: str = "<input>", globals_dict: Optional[Dict]
             "result": None,
             "output": "",
             "message": "No code to execute",
-            "branding": "Powered by pyDefine"
+            "branding": _BRANDING
         }
     
     if globals_dict is None:
         globals_dict = {
-            "__builtins__": {
-                "print": print,
-                "len": len,
-                "range": range,
-                "int": int,
-                "float": float,
-                "str": str,
-                "bool": bool,
-                "list": list,
-                "dict": dict,
-                "tuple": tuple,
-                "set": set,
-                "abs": abs,
-                "min": min,
-                "max": max,
-                "sum": sum,
-                "sorted": sorted,
-                "reversed": reversed,
-                "enumerate": enumerate,
-                "zip": zip,
-                "map": map,
-                "filter": filter,
-                "round": round,
-                "pow": pow,
-                "isinstance": isinstance,
-                "type": type,
-                "dir": dir,
-                "help": help,
-            },
+            # Copy so one run's code can't change the builtins seen by the next
+            "__builtins__": dict(_SAFE_BUILTINS),
             "__name__": "__main__",
             "__file__": filename,
         }
@@ -169,36 +294,59 @@ def safe_run(code: str, filename: str = "<input>", globals_dict: Optional[Dict]
     if locals_dict is None:
         locals_dict = {}
     
-    import io
-    old_stdout = sys.stdout
-    sys.stdout = captured_output = io.StringIO()
+    captured_output = io.StringIO()
+    if capture_output:
+        redirect = contextlib.redirect_stdout(captured_output)
+    else:
+        redirect = contextlib.nullcontext()
     
+    value = None
     try:
-        compiled_code = compile(code, filename, 'exec')
-        exec(compiled_code, globals_dict, locals_dict)
-        output = captured_output.getvalue()
-        sys.stdout = old_stdout
-        return {
-            "success": True,
-            "result": locals_dict.get("result", None),
-            "output": output,
-            "message": "Code executed successfully",
-            "branding": "Powered by pyDefine"
-        }
+        if len(code) <= _MAX_CACHED_TEXT:
+            compiled_code, is_expression = _compile(code, filename)
+        else:
+            compiled_code, is_expression = _compile.__wrapped__(code, filename)
+        with redirect:
+            if is_expression:
+                value = eval(compiled_code, globals_dict, locals_dict)
+            else:
+                exec(compiled_code, globals_dict, locals_dict)
     except Exception as e:
-        sys.stdout = old_stdout
-        tb_lines = traceback.format_exception(type(e), e, e.__traceback__)
-        tb_text = ''.join(tb_lines)
-        decoded = decode_traceback(tb_text)
+        decoded = decode_exception(e)
         decoded["success"] = False
         decoded["output"] = captured_output.getvalue()
         return decoded
+    return {
+        "success": True,
+        # A `result` variable wins; a lone expression ("1 + 2") gives its value
+        "result": locals_dict.get("result", value),
+        "output": captured_output.getvalue(),
+        "message": "Code executed successfully",
+        "branding": _BRANDING
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(code: str, filename: str):
+    # Code objects are immutable, so re-running a snippet can reuse one.
+    # SyntaxErrors propagate and are never cached.
+    # Parse once; a single bare expression is compiled in 'eval' mode so
+    # safe_run can hand back its value.
+    tree = compile(code, filename, 'exec', ast.PyCF_ONLY_AST)
+    if len(tree.body) == 1 and isinstance(tree.body[0], ast.Expr):
+        return compile(ast.Expression(tree.body[0].value), filename, 'eval'), True
+    return compile(tree, filename, 'exec'), False
 
 
 def decode_traceback_file(filepath: str) -> Dict[str, Any]:
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            traceback_text = f.read()
+        # An unchanged small file (same path, mtime and size) is not read again
+        st = os.stat(filepath)
+        if st.st_size <= _MAX_CACHED_TEXT:
+            read = _read_traceback_file
+        else:
+            read = _read_traceback_file.__wrapped__
+        traceback_text = read(os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
         return decode_traceback(traceback_text)
     except FileNotFoundError:
         return {
@@ -209,7 +357,7 @@ def decode_traceback_file(filepath: str) -> Dict[str, Any]:
             "fix_suggestion": f"Check if the file path '{filepath}' is correct",
             "tags": ["file", "not-found"],
             "emoji": "📁",
-            "branding": "Powered by pyDefine"
+            "branding": _BRANDING
         }
     except Exception as e:
         return {
@@ -220,15 +368,58 @@ def decode_traceback_file(filepath: str) -> Dict[str, Any]:
             "fix_suggestion": "Check file permissions and format",
             "tags": ["file", "read-error"],
             "emoji": "📁",
-            "branding": "Powered by pyDefine"
+            "branding": _BRANDING
         }
 
 
+# Files above this size are read backwards in chunks of this size
+_TAIL_CHUNK = 64 * 1024
+_TRACEBACK_MARKER = b"Traceback (most recent call last):"
+
+
+@functools.lru_cache(maxsize=64)
+def _read_traceback_file(path: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns and size are only part of the cache key, so an edited file misses.
+    # One bulk decode; stray non-UTF-8 bytes in a log shouldn't stop decoding
+    with open(path, 'rb') as f:
+        data = f.read() if size <= _TAIL_CHUNK else _read_last_traceback(f, size)
+    return data.decode('utf-8', errors='replace')
+
+
+def _read_last_traceback(f, size: int) -> bytes:
+    # Only the last traceback in a log is decoded, so scan back from the end
+    # for its header instead of loading the whole file
+    chunks = []
+    # Bytes just after the current chunk, for a header straddling a boundary
+    overlap = b""
+    pos = size
+    while pos > 0:
+        step = min(_TAIL_CHUNK, pos)
+        pos -= step
+        f.seek(pos)
+        chunk = f.read(step)
+        window = chunk + overlap
+        # overlap is shorter than the header, so a match always starts in chunk
+        idx = window.rfind(_TRACEBACK_MARKER)
+        if idx != -1:
+            chunks.append(chunk[idx:])
+            break
+        chunks.append(chunk)
+        overlap = window[:len(_TRACEBACK_MARKER) - 1]
+    # Chunks were collected back to front; join once (no header: the whole file)
+    return b"".join(reversed(chunks))
+
+
 def explain(exception_or_traceback: Union[Exception, str]) -> str:
+    # Only the emoji and explanation are used, so skip formatted_output and tokens
     if isinstance(exception_or_traceback, BaseException):
-        decoded = decode_exception(exception_or_traceback)
+        decoded = decode_exception(
+            exception_or_traceback, include_formatted=False, include_tokens=False
+        )
     elif isinstance(exception_or_traceback, str):
-        decoded = decode_traceback(exception_or_traceback)
+        decoded = decode_traceback(
+            exception_or_traceback, include_formatted=False, include_tokens=False
+        )
     else:
         return "❓ Invalid input - pass an exception object or traceback string"
     
@@ -238,7 +429,8 @@ def explain(exception_or_traceback: Union[Exception, str]) -> str:
 
 
 def quick_decode(e: Exception) -> None:
-    decoded = decode_exception(e)
+    # Prints its own layout, so formatted_output and tokens would go unused
+    decoded = decode_exception(e, include_formatted=False, include_tokens=False)
     print("\n" + "="*70)
     print(f"🔍 {decoded['error_type']}: {decoded['original_message']}")
     print("="*70)
@@ -14,9 +14,13 @@ Usage:
     translated = translate_explanation(explanation, 'hi')
 """
 
+import functools
+import logging
 import re
 from typing import Dict, Optional
 
+_log = logging.getLogger(__name__)
+
 # Current language (default: English)
 _current_language = "en"
 
@@ -27,6 +31,103 @@ SUPPORTED_LANGUAGES = {
 }
 
 
+# Basic word-level replacements for Hinglish (stub implementation)
+_HINGLISH_REPLACEMENTS = {
+    # Common programming terms (keep English)
+    "Python": "Python",
+    "code": "code",
+    "function": "function",
+    "variable": "variable",
+    "file": "file",
+    "error": "error",
+    "exception": "exception",
+    
+    # Verbs and actions
+    "You tried": "Aapne koshish ki",
+    "You wrote": "Aapne likha",
+    "You pressed": "Aapne press kiya",
+    "tried to": "koshish ki",
+    "doesn't exist": "exist nahi karta",
+    "doesn't follow": "follow nahi karta",
+    "couldn't find": "nahi mil saka",
+    "can't find": "nahi mil sakta",
+    "doesn't have": "ke paas nahi hai",
+    
+    # Nouns
+    "the language rules": "language ke rules",
+    "the wrong type": "galat type",
+    "a dictionary": "ek dictionary",
+    "a list": "ek list",
+    "a file": "ek file",
+    "a folder": "ek folder",
+    "the program": "program",
+    "the computer": "computer",
+    
+    # Descriptors
+    "wrong": "galat",
+    "correct": "sahi",
+    "invalid": "invalid",
+    "missing": "missing",
+    "too big": "bahut bada",
+    "too long": "bahut lamba",
+    
+    # Common phrases
+    "It's like": "Yeh aisa hai jaise",
+    "This is": "Yeh hai",
+    "Something went wrong": "Kuch galat ho gaya",
+    "Check": "Check karein",
+    "Make sure": "Pakka karein",
+    "Use": "Use karein",
+    "Install": "Install karein",
+}
+
+# Compiled on first Hinglish translation, so English-only users never pay for it
+_hinglish_re = None
+
+
+def _get_hinglish_re() -> re.Pattern:
+    """
+    Return the regex matching any Hinglish replacement phrase.
+    
+    One alternation of every phrase, longest first (re tries alternatives
+    in order at each position), so the text is scanned once instead of
+    once per phrase.
+    """
+    global _hinglish_re
+    if _hinglish_re is None:
+        phrases = sorted(_HINGLISH_REPLACEMENTS, key=len, reverse=True)
+        _hinglish_re = re.compile("|".join(re.escape(english) for english in phrases))
+    return _hinglish_re
+
+
+@functools.lru_cache(maxsize=256)
+def _translate_to_hinglish(text: str) -> str:
+    """
+    Translate English text to Hinglish (Hindi + English mix).
+    
+    This is a stub implementation with basic word replacements.
+    For production, integrate with a proper translation API.
+    
+    Args:
+        text: English text
+        
+    Returns:
+        Hinglish text
+    """
+    return _get_hinglish_re().sub(_hinglish_for, text)
+
+
+def _hinglish_for(match: re.Match) -> str:
+    """Replacement callback for the Hinglish phrase regex."""
+    return _HINGLISH_REPLACEMENTS[match.group(0)]
+
+
+# Language code -> translator; English needs none and is never listed
+_TRANSLATORS = {
+    "hi": _translate_to_hinglish,
+}
+
+
 def set_language(language_code: str) -> bool:
     """
     Set the current language for translations.
@@ -49,7 +150,7 @@ def set_language(language_code: str) -> bool:
         _current_language = language_code
         return True
     else:
-        print(f"⚠️  Warning: Language '{language_code}' not supported. Using English.")
+        _log.warning("Language %r not supported. Using English.", language_code)
         return False
 
 
@@ -79,86 +180,21 @@ def translate_explanation(text: str, target_language: str) -> str:
         >>> translate_explanation(text, 'hi')
         "Aapne zero se divide karne ki koshish ki"
     """
-    if target_language == "en":
+    translator = _TRANSLATORS.get(target_language)
+    if translator is None:
+        # English, or no translator yet: fall back to the original text
         return text
-    
-    if target_language == "hi":
-        return _translate_to_hinglish(text)
-    
-    # Fallback to English
-    return text
+    return translator(text)
 
 
-def _translate_to_hinglish(text: str) -> str:
+def clear_translation_cache() -> None:
     """
-    Translate English text to Hinglish (Hindi + English mix).
-    
-    This is a stub implementation with basic word replacements.
-    For production, integrate with a proper translation API.
+    Clear cached translations.
     
-    Args:
-        text: English text
-        
-    Returns:
-        Hinglish text
+    Translations are memoized per input text, so a repeated explanation
+    is only translated once. This releases that memory.
     """
-    # Basic word-level replacements (stub implementation)
-    replacements = {
-        # Common programming terms (keep English)
-        "Python": "Python",
-        "code": "code",
-        "function": "function",
-        "variable": "variable",
-        "file": "file",
-        "error": "error",
-        "exception": "exception",
-        
-        # Verbs and actions
-        "You tried": "Aapne koshish ki",
-        "You wrote": "Aapne likha",
-        "You pressed": "Aapne press kiya",
-        "tried to": "koshish ki",
-        "doesn't exist": "exist nahi karta",
-        "doesn't follow": "follow nahi karta",
-        "couldn't find": "nahi mil saka",
-        "can't find": "nahi mil sakta",
-        "doesn't have": "ke paas nahi hai",
-        
-        # Nouns
-        "the language rules": "language ke rules",
-        "the wrong type": "galat type",
-        "a dictionary": "ek dictionary",
-        "a list": "ek list",
-        "a file": "ek file",
-        "a folder": "ek folder",
-        "the program": "program",
-        "the computer": "computer",
-        
-        # Descriptors
-        "wrong": "galat",
-        "correct": "sahi",
-        "invalid": "invalid",
-        "missing": "missing",
-        "too big": "bahut bada",
-        "too long": "bahut lamba",
-        
-        # Common phrases
-        "It's like": "Yeh aisa hai jaise",
-        "This is": "Yeh hai",
-        "Something went wrong": "Kuch galat ho gaya",
-        "Check": "Check karein",
-        "Make sure": "Pakka karein",
-        "Use": "Use karein",
-        "Install": "Install karein",
-    }
-    
-    translated = text
-    
-    # Apply replacements (longer phrases first to avoid partial matches)
-    for english, hinglish in sorted(replacements.items(), key=lambda x: -len(x[0])):
-        translated = translated.replace(english, hinglish)
-    
-    return translated
+    _translate_to_hinglish.cache_clear()
 
 
 def get_supported_languages() -> Dict[str, str]:
@@ -337,6 +373,7 @@ __all__ = [
     'set_language',
     'get_language',
     'translate_explanation',
+    'clear_translation_cache',
     'get_supported_languages',
     'is_language_supported',
     'get_translated_template',
@@ -15,6 +15,25 @@ dictionaries containing:
 All explanations are written for absolute beginners with no jargon.
 """
 
+import re
+import sys
+from types import MappingProxyType
+
+# Fallback for unknown exceptions
+_FALLBACK_INFO = {
+    "simple_explanation": (
+        "An error occurred that we don't have detailed info about yet. "
+        "Something unexpected went wrong in your code. "
+        "Check the error name for clues ❓"
+    ),
+    "fix_suggestion": (
+        "Read the full error message carefully, search online for the error name, "
+        "or check the documentation for what you're trying to do"
+    ),
+    "tags": ["unknown", "general", "unhandled"],
+    "emoji": "❓"
+}
+
 # Complete mapping of 80+ built-in Python exceptions
 EXCEPTION_MAP = {
     # =========================================================================
@@ -986,29 +1005,44 @@ def get_exception_info(exception_name: str) -> dict:
     Returns:
         Dictionary with explanation, fix_suggestion, tags, and emoji.
         Returns fallback info if exception not found.
+        
+        For a known exception this is the EXCEPTION_MAP entry itself, not a
+        copy, so don't modify it (or its tags list) in place; copy it first,
+        e.g. ``dict(info, tags=list(info["tags"]))``.
     """
-    if exception_name in EXCEPTION_MAP:
+    # Known names are the common case, so try the lookup first and only
+    # pay for the fallback on a miss. Hits hand out the shared entry uncopied
+    try:
         return EXCEPTION_MAP[exception_name]
+    except KeyError:
+        # Fresh copy so callers can't modify the shared fallback
+        return {**_FALLBACK_INFO, "tags": list(_FALLBACK_INFO["tags"])}
+
+
+def resolve_exception_name(exception_type: type) -> str:
+    """
+    Find the closest EXCEPTION_MAP entry for an exception class.
     
-    # Fallback for unknown exceptions
-    return {
-        "simple_explanation": (
-            "An error occurred that we don't have detailed info about yet. "
-            "Something unexpected went wrong in your code. "
-            "Check the error name for clues ❓"
-        ),
-        "fix_suggestion": (
-            "Read the full error message carefully, search online for the error name, "
-            "or check the documentation for what you're trying to do"
-        ),
-        "tags": ["unknown", "general", "unhandled"],
-        "emoji": "❓"
-    }
+    Walks the class MRO, so user-defined subclasses (e.g. a custom
+    ``ConfigError(ValueError)``) get the explanation of their nearest
+    built-in parent.
+    
+    Args:
+        exception_type: Exception class (e.g., type(e))
+        
+    Returns:
+        Name of the closest mapped class, or the class's own name if
+        nothing in its MRO is mapped
+    """
+    for cls in exception_type.__mro__:
+        if cls.__name__ in EXCEPTION_MAP:
+            return cls.__name__
+    return exception_type.__name__
 
 
 def list_all_exceptions() -> list:
     """Return sorted list of all exception names in the mapping."""
-    return sorted(EXCEPTION_MAP.keys())
+    return list(_ALL_EXCEPTIONS_SORTED)
 
 
 def search_exceptions_by_tag(tag: str) -> list:
@@ -1021,12 +1055,87 @@ def search_exceptions_by_tag(tag: str) -> list:
     Returns:
         List of exception names matching the tag
     """
-    results = []
+    return list(TAGS_INDEX.get(tag.lower(), ()))
+
+
+def find_exceptions(text: str) -> list:
+    """
+    Find every known exception name mentioned in a piece of text.
+    
+    Uses one precompiled regex over all EXCEPTION_MAP names, so the text
+    is scanned once instead of once per exception.
+    
+    Args:
+        text: Any text, e.g. a traceback or a log excerpt
+        
+    Returns:
+        List of exception names in the order they appear (with repeats)
+    """
+    if not text:
+        return []
+    return _EXCEPTION_NAME_RE.findall(text)
+
+
+def _intern_all() -> None:
+    """
+    Intern the string values of EXCEPTION_MAP in place.
+    
+    Emojis and tags repeat across many entries; interning makes every
+    result built from the map share one string object per distinct value.
+    """
+    for exc_info in EXCEPTION_MAP.values():
+        for field in ("simple_explanation", "fix_suggestion", "emoji"):
+            if isinstance(exc_info.get(field), str):
+                exc_info[field] = sys.intern(exc_info[field])
+        if "tags" in exc_info:
+            exc_info["tags"][:] = [sys.intern(tag) for tag in exc_info["tags"]]
+
+
+_intern_all()
+
+# The indexes and statistics below are snapshots of the map, so names can't
+# be added, replaced or removed at runtime; new entries belong in the literal
+# above. Only the outer mapping is protected: the entries (and their tags
+# lists) are shared and must not be modified in place. Use dict(EXCEPTION_MAP)
+# where a real dict is needed, e.g. for json.dumps() or copy.deepcopy()
+EXCEPTION_MAP = MappingProxyType(EXCEPTION_MAP)
+
+
+def _build_tags_index() -> dict:
+    """Invert EXCEPTION_MAP into lowercase tag -> sorted exception names."""
+    index = {}
+    for exc_name, exc_info in EXCEPTION_MAP.items():
+        for tag in exc_info.get("tags", []):
+            index.setdefault(tag.lower(), set()).add(exc_name)
+    return {tag: tuple(sorted(names)) for tag, names in index.items()}
+
+
+def _build_category_index() -> dict:
+    """Group EXCEPTION_MAP names under each of their tags, in map order."""
+    index = {}
     for exc_name, exc_info in EXCEPTION_MAP.items():
-        if tag.lower() in [t.lower() for t in exc_info.get("tags", [])]:
-            results.append(exc_name)
-    return sorted(results)
+        for tag in exc_info.get("tags", []):
+            index.setdefault(tag, []).append(exc_name)
+    return {tag: tuple(names) for tag, names in index.items()}
+
+
+# Tag lookups are a single dict probe instead of a scan over every entry.
+# Both indexes are read-only, like EXCEPTION_MAP, since search_exceptions_by_tag
+# and callers share them
+TAGS_INDEX = MappingProxyType(_build_tags_index())
 
+# Category tag (e.g. "file", "syntax") -> exception names carrying it, in map order
+CATEGORY_INDEX = MappingProxyType(_build_category_index())
+
+# One alternation over every known name; \b keeps matches to whole names
+# so "MyValueError" is not reported as "ValueError"
+_EXCEPTION_NAME_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(EXCEPTION_MAP))) + r")\b"
+)
+
+
+# The map never changes after import, so sort its names only once
+_ALL_EXCEPTIONS_SORTED = tuple(sorted(EXCEPTION_MAP))
 
 # Statistics about the mapping
 TOTAL_EXCEPTIONS = len(EXCEPTION_MAP)
@@ -1035,3 +1144,21 @@ ALL_TAGS = sorted(set(
     for exc_info in EXCEPTION_MAP.values() 
     for tag in exc_info.get("tags", [])
 ))
+# Same tags for membership tests ("syntax" in ALL_TAGS_SET), without a list scan
+ALL_TAGS_SET = frozenset(ALL_TAGS)
+
+
+# Export public API
+__all__ = [
+    'EXCEPTION_MAP',
+    'get_exception_info',
+    'resolve_exception_name',
+    'list_all_exceptions',
+    'search_exceptions_by_tag',
+    'find_exceptions',
+    'TAGS_INDEX',
+    'CATEGORY_INDEX',
+    'TOTAL_EXCEPTIONS',
+    'ALL_TAGS',
+    'ALL_TAGS_SET',
+]
@@ -8,12 +8,55 @@ formatting output, and tokenizing for rich display.
 These are helper functions used by core.py and other modules.
 """
 
+import os
 import re
 import sys
 from typing import Dict, Any, List, Optional, Tuple
 
+# Traceback frame line, e.g.: File "filename.py", line 123, in function_name
+# Compiled once at import since every decode goes through it
+_FILE_LINE_RE = re.compile(r'File "([^"]+)", line (\d+)')
 
-def extract_error_info(traceback_text: str) -> Dict[str, Any]:
+# Rich content markers in explanations: [IMG:url] and [AUDIO:url]
+_IMG_RE = re.compile(r'\[IMG:([^\]]+)\]')
+_AUDIO_RE = re.compile(r'\[AUDIO:([^\]]+)\]')
+
+# ANSI terminal escape sequences (colors, cursor movement)
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Common exception name pattern: CapitalizedWord ending in Error or Exception
+_EXCEPTION_NAME_RE = re.compile(r'\b([A-Z][a-zA-Z]*(?:Error|Exception|Warning))\b')
+
+# The interpreter version can't change while running, so format it once
+_PY_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+
+# Exception name -> category, built once so get_error_category is one dict probe
+_CATEGORY_MAP = {
+    error_type: category
+    for category, error_types in (
+        ("Syntax", ("SyntaxError", "IndentationError", "TabError")),
+        ("Type", ("TypeError", "ValueError", "AttributeError")),
+        ("Name", ("NameError", "UnboundLocalError")),
+        ("Lookup", ("KeyError", "IndexError", "LookupError")),
+        ("File/IO", ("FileNotFoundError", "FileExistsError", "PermissionError",
+                     "IsADirectoryError", "NotADirectoryError", "IOError", "OSError")),
+        ("Import", ("ImportError", "ModuleNotFoundError")),
+        ("Arithmetic", ("ZeroDivisionError", "OverflowError", "FloatingPointError",
+                        "ArithmeticError")),
+        ("Runtime", ("RuntimeError", "RecursionError", "NotImplementedError")),
+        ("Connection", ("ConnectionError", "BrokenPipeError", "ConnectionAbortedError",
+                        "ConnectionRefusedError", "ConnectionResetError", "TimeoutError")),
+    )
+    for error_type in error_types
+}
+
+# Syntax-related names, taken from the "Syntax" category so the two can't drift
+_SYNTAX_ERRORS = frozenset(
+    error_type for error_type, category in _CATEGORY_MAP.items() if category == "Syntax"
+)
+
+
+def extract_error_info(traceback_text: str, *, collect_frames: bool = True) -> Dict[str, Any]:
     """
     Extract structured information from a raw traceback string.
     
@@ -26,6 +69,9 @@ def extract_error_info(traceback_text: str) -> Dict[str, Any]:
     
     Args:
         traceback_text: Raw traceback string (multi-line)
+        collect_frames: Fill in "frames". Pass False when only the error
+            location is needed; the lines are then scanned bottom-up and
+            the scan stops at the innermost frame ("frames" stays empty)
         
     Returns:
         Dictionary with extracted information
@@ -68,12 +114,38 @@ def extract_error_info(traceback_text: str) -> Dict[str, Any]:
         result["error_type"] = last_line.strip()
         result["original_message"] = ""
     
-    # Extract file and line information
-    # Pattern: File "filename.py", line 123, in function_name
-    file_line_pattern = r'File "([^"]+)", line (\d+)'
+    # A bare "ErrorType: message" line has no frames, so skip the regex scan
+    if len(lines) == 1 and 'File "' not in last_line:
+        return result
+    
+    if not collect_frames:
+        # The last frame line is the innermost one, so scan from the bottom.
+        # SyntaxError keeps looking for the last line that starts with 'File "'
+        is_syntax_error = result["error_type"] == "SyntaxError"
+        for line in reversed(lines):
+            # Source and message lines are skipped with a plain substring test
+            if 'File "' not in line:
+                continue
+            match = _FILE_LINE_RE.search(line)
+            if match is None:
+                continue
+            starts_with_file = line.strip().startswith('File "')
+            if result["file_name"] is None or starts_with_file:
+                result["file_name"] = match.group(1)
+                result["line_number"] = int(match.group(2))
+            if not is_syntax_error or starts_with_file:
+                break
+        return result
+    
+    # Last match on a line that starts with 'File "' (see SyntaxError below)
+    syntax_location = None
     
+    # Extract file and line information
     for line in lines:
-        match = re.search(file_line_pattern, line)
+        # Most lines are source or message lines; skip them before the regex
+        if 'File "' not in line:
+            continue
+        match = _FILE_LINE_RE.search(line)
         if match:
             file_name = match.group(1)
             line_number = int(match.group(2))
@@ -82,21 +154,20 @@ def extract_error_info(traceback_text: str) -> Dict[str, Any]:
             result["file_name"] = file_name
             result["line_number"] = line_number
             
+            text = line.strip()
+            if text.startswith('File "'):
+                syntax_location = (file_name, line_number)
+            
             result["frames"].append({
                 "file": file_name,
                 "line": line_number,
-                "text": line.strip()
+                "text": text
             })
     
     # Handle SyntaxError special case (has additional info)
-    if result["error_type"] == "SyntaxError":
+    if result["error_type"] == "SyntaxError" and syntax_location is not None:
         # SyntaxError often has the file/line in a different format
-        for i, line in enumerate(lines):
-            if line.strip().startswith('File "'):
-                match = re.search(r'File "([^"]+)", line (\d+)', line)
-                if match:
-                    result["file_name"] = match.group(1)
-                    result["line_number"] = int(match.group(2))
+        result["file_name"], result["line_number"] = syntax_location
     
     return result
 
@@ -211,16 +282,17 @@ def tokenize_output(decoded_info: Dict[str, Any]) -> List[Dict[str, str]]:
     if explanation:
         tokens.append({"type": "explanation", "content": explanation})
         
-        # Check for special rich content markers
+        # Check for special rich content markers; they are rare, so only
+        # run the regex when the marker text is present
         # [IMG:url] for images
-        img_matches = re.findall(r'\[IMG:([^\]]+)\]', explanation)
-        for img_url in img_matches:
-            tokens.append({"type": "image", "content": img_url})
+        if '[IMG:' in explanation:
+            for img_url in _IMG_RE.findall(explanation):
+                tokens.append({"type": "image", "content": img_url})
         
         # [AUDIO:url] for audio
-        audio_matches = re.findall(r'\[AUDIO:([^\]]+)\]', explanation)
-        for audio_url in audio_matches:
-            tokens.append({"type": "audio", "content": audio_url})
+        if '[AUDIO:' in explanation:
+            for audio_url in _AUDIO_RE.findall(explanation):
+                tokens.append({"type": "audio", "content": audio_url})
     
     # Fix suggestion token
     fix_suggestion = decoded_info.get("fix_suggestion", "")
@@ -260,8 +332,10 @@ def strip_ansi_codes(text: str) -> str:
     Returns:
         Clean text without ANSI codes
     """
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    # Every ANSI sequence starts with ESC; most tracebacks have none
+    if '\x1b' not in text:
+        return text
+    return _ANSI_RE.sub('', text)
 
 
 def truncate_message(message: str, max_length: int = 200) -> str:
@@ -292,9 +366,7 @@ def extract_exception_from_string(text: str) -> Optional[str]:
     Returns:
         Exception name if found, None otherwise
     """
-    # Common exception name pattern: CapitalizedWord ending in Error or Exception
-    pattern = r'\b([A-Z][a-zA-Z]*(?:Error|Exception|Warning))\b'
-    matches = re.findall(pattern, text)
+    matches = _EXCEPTION_NAME_RE.findall(text)
     
     # Return the last match (most specific)
     return matches[-1] if matches else None
@@ -307,7 +379,7 @@ def get_python_version() -> str:
     Returns:
         Python version (e.g., "3.10.5")
     """
-    return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    return _PY_VERSION
 
 
 def is_syntax_error(error_type: str) -> bool:
@@ -320,12 +392,7 @@ def is_syntax_error(error_type: str) -> bool:
     Returns:
         True if syntax-related, False otherwise
     """
-    syntax_errors = [
-        "SyntaxError",
-        "IndentationError",
-        "TabError"
-    ]
-    return error_type in syntax_errors
+    return error_type in _SYNTAX_ERRORS
 
 
 def get_error_category(error_type: str) -> str:
@@ -338,38 +405,7 @@ def get_error_category(error_type: str) -> str:
     Returns:
         Category name (e.g., "Syntax", "Type", "File", etc.)
     """
-    syntax_errors = ["SyntaxError", "IndentationError", "TabError"]
-    type_errors = ["TypeError", "ValueError", "AttributeError"]
-    name_errors = ["NameError", "UnboundLocalError"]
-    lookup_errors = ["KeyError", "IndexError", "LookupError"]
-    file_errors = ["FileNotFoundError", "FileExistsError", "PermissionError", 
-                   "IsADirectoryError", "NotADirectoryError", "IOError", "OSError"]
-    import_errors = ["ImportError", "ModuleNotFoundError"]
-    arithmetic_errors = ["ZeroDivisionError", "OverflowError", "FloatingPointError", "ArithmeticError"]
-    runtime_errors = ["RuntimeError", "RecursionError", "NotImplementedError"]
-    connection_errors = ["ConnectionError", "BrokenPipeError", "ConnectionAbortedError",
-                        "ConnectionRefusedError", "ConnectionResetError", "TimeoutError"]
-    
-    if error_type in syntax_errors:
-        return "Syntax"
-    elif error_type in type_errors:
-        return "Type"
-    elif error_type in name_errors:
-        return "Name"
-    elif error_type in lookup_errors:
-        return "Lookup"
-    elif error_type in file_errors:
-        return "File/IO"
-    elif error_type in import_errors:
-        return "Import"
-    elif error_type in arithmetic_errors:
-        return "Arithmetic"
-    elif error_type in runtime_errors:
-        return "Runtime"
-    elif error_type in connection_errors:
-        return "Connection"
-    else:
-        return "Other"
+    return _CATEGORY_MAP.get(error_type, "Other")
 
 
 def clean_traceback_text(traceback_text: str) -> str:
@@ -387,8 +423,9 @@ def clean_traceback_text(traceback_text: str) -> str:
     # Remove ANSI codes
     cleaned = strip_ansi_codes(traceback_text)
     
-    # Normalize line endings
-    cleaned = cleaned.replace('\r\n', '\n').replace('\r', '\n')
+    # Normalize line endings (Unix-style text has no '\r' to replace)
+    if '\r' in cleaned:
+        cleaned = cleaned.replace('\r\n', '\n').replace('\r', '\n')
     
     # Remove excessive blank lines
     lines = cleaned.split('\n')
@@ -426,6 +463,30 @@ def highlight_code_line(code_line: str, position: Optional[int] = None) -> str:
     return '\n'.join(result)
 
 
+def show_branding() -> None:
+    """
+    Print the pyDefine branding line to stderr.
+    
+    Branding is opt-in: call this directly, or set the environment
+    variable PYDEFINE_BRANDING=1 to show it the first time pyDefine
+    decodes or runs something.
+    """
+    sys.stderr.write("✨ Powered by pyDefine ✨\n")
+
+
+_branding_checked = False
+
+
+def _maybe_show_branding() -> None:
+    """Show branding once, on first real use, if PYDEFINE_BRANDING=1."""
+    global _branding_checked
+    if _branding_checked:
+        return
+    _branding_checked = True
+    if os.environ.get("PYDEFINE_BRANDING") == "1":
+        show_branding()
+
+
 # Export all utility functions
 __all__ = [
     'extract_error_info',
@@ -439,4 +500,5 @@ __all__ = [
     'get_error_category',
     'clean_traceback_text',
     'highlight_code_line',
+    'show_branding',
 ]
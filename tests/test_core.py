@@ -12,6 +12,8 @@ import sys
 from pydefine.core import (
     decode_traceback, 
     decode_exception, 
+    decode_many,
+    decode_exception_name,
     safe_run,
     decode_traceback_file,
     explain,
@@ -103,6 +105,15 @@ TypeError: can only concatenate str (not "int") to str"""
         result = decode_traceback(None)
         assert result['error_type'] == 'InvalidInput'
     
+    def test_decode_single_line(self):
+        """Test decoding a bare 'ErrorType: message' line."""
+        result = decode_traceback("ValueError: invalid literal for int() with base 10: 'abc'")
+        
+        assert result['error_type'] == 'ValueError'
+        assert result['original_message'] == "invalid literal for int() with base 10: 'abc'"
+        assert result['line_number'] is None
+        assert result['file_name'] is None
+    
     def test_decode_unknown_error(self):
         """Test decoding an unknown/custom error."""
         traceback_text = """Traceback (most recent call last):
@@ -141,6 +152,26 @@ NameError: name 'undefined_var' is not defined"""
         assert 'formatted_output' in result
         assert isinstance(result['formatted_output'], str)
         assert len(result['formatted_output']) > 0
+    
+    def test_formatted_output_can_be_skipped(self):
+        """Test that include_formatted=False leaves out formatted_output."""
+        traceback_text = """Traceback (most recent call last):
+  File "test.py", line 1, in <module>
+    1/0
+ZeroDivisionError: division by zero"""
+        
+        result = decode_traceback(traceback_text, include_formatted=False)
+        
+        assert 'formatted_output' not in result
+        assert result['error_type'] == 'ZeroDivisionError'
+    
+    def test_tokens_can_be_skipped(self):
+        """Test that include_tokens=False leaves out tokens."""
+        result = decode_traceback("ZeroDivisionError: division by zero", include_tokens=False)
+        
+        assert 'tokens' not in result
+        assert 'formatted_output' in result
+        assert 'tokens' in decode_traceback("ZeroDivisionError: division by zero")
 
 
 class TestDecodeException:
@@ -209,6 +240,84 @@ class TestDecodeException:
             assert 'file_name' in result
 
 
+class TestDecodeCaching:
+    """Test that repeated decoding is cached without sharing result dicts."""
+    
+    def test_repeated_decode_returns_equal_results(self):
+        """Test decoding the same traceback twice gives the same result."""
+        tb = """Traceback (most recent call last):
+  File "test.py", line 1, in <module>
+    1/0
+ZeroDivisionError: division by zero"""
+        
+        assert decode_traceback(tb) == decode_traceback(tb)
+    
+    def test_cached_result_is_not_shared(self):
+        """Test that mutating a result does not leak into later calls."""
+        from pydefine.mapping import get_exception_info
+        
+        tb = """Traceback (most recent call last):
+  File "test.py", line 1, in <module>
+    print(x)
+NameError: name 'x' is not defined"""
+        
+        first = decode_traceback(tb)
+        first['success'] = True
+        first['extra'] = 'value'
+        
+        second = decode_traceback(tb)
+        assert second['success'] is False
+        assert 'extra' not in second
+        
+        second['tags'].append('mutated')
+        second['tokens'][0]['content'] = 'mutated'
+        second['tokens'].clear()
+        
+        third = decode_traceback(tb)
+        assert 'mutated' not in third['tags']
+        assert third['tokens'] and third['tokens'][0]['content'] != 'mutated'
+        assert isinstance(third['tags'], list)
+        assert isinstance(third['tokens'], list)
+        assert 'mutated' not in get_exception_info('NameError')['tags']
+    
+    def test_repeated_traceback_is_parsed_once(self):
+        """Test that identical traceback text is not re-parsed."""
+        from pydefine.core import _parse_traceback
+        tb = """Traceback (most recent call last):
+  File "cache.py", line 7, in <module>
+    d['k']
+KeyError: 'k'"""
+        
+        decode_traceback(tb)
+        hits = _parse_traceback.cache_info().hits
+        result = decode_traceback(tb)
+        assert _parse_traceback.cache_info().hits == hits + 1
+        assert result['error_type'] == 'KeyError'
+        assert result['line_number'] == 7
+    
+    def test_huge_message_is_not_cached(self):
+        """Test that a very long error message is not kept in the result cache."""
+        from pydefine.core import _build_result, _MAX_CACHED_TEXT
+        
+        size = _build_result.cache_info().currsize
+        result = decode_traceback("ValueError: " + "x" * (_MAX_CACHED_TEXT + 1))
+        
+        assert result['error_type'] == 'ValueError'
+        assert len(result['original_message']) == _MAX_CACHED_TEXT + 1
+        assert _build_result.cache_info().currsize == size
+    
+    def test_huge_traceback_is_not_cached(self):
+        """Test that very long traceback text is parsed without being cached."""
+        from pydefine.core import _parse_traceback, _MAX_CACHED_TEXT
+        tb = "INFO noise\n" * (_MAX_CACHED_TEXT // 10) + "ValueError: bad value"
+        
+        size = _parse_traceback.cache_info().currsize
+        result = decode_traceback(tb)
+        
+        assert result['error_type'] == 'ValueError'
+        assert _parse_traceback.cache_info().currsize == size
+
+
 class TestSafeRun:
     """Test safe_run function."""
     
@@ -245,6 +354,26 @@ class TestSafeRun:
         assert result['success'] is False
         assert result['error_type'] == 'SyntaxError'
     
+    def test_safe_run_syntax_error_location(self):
+        """Test that syntax errors point at the bad line of user code."""
+        code = "x = 1\nif True print('test')"
+        result = safe_run(code, filename="broken.py")
+        
+        assert result['error_type'] == 'SyntaxError'
+        assert result['file_name'] == 'broken.py'
+        assert result['line_number'] == 2
+    
+    def test_large_code_is_not_cached(self):
+        """Test that a large script runs without its source being cached."""
+        from pydefine.core import _compile, _MAX_CACHED_TEXT
+        code = "# padding\n" * (_MAX_CACHED_TEXT // 10) + "result = 42"
+        
+        size = _compile.cache_info().currsize
+        result = safe_run(code)
+        
+        assert result['result'] == 42
+        assert _compile.cache_info().currsize == size
+    
     def test_safe_run_empty_code(self):
         """Test with empty code."""
         result = safe_run("")
@@ -271,6 +400,37 @@ print(x + y)
         assert result['success'] is True
         assert '15' in result['output']
     
+    def test_safe_run_repeated_code(self):
+        """Test that re-running the same snippet executes it again."""
+        code = "print('again')"
+        first = safe_run(code)
+        second = safe_run(code)
+        
+        assert first['output'] == second['output'] == "again\n"
+    
+    def test_safe_run_expression_value(self):
+        """Test that a single expression returns its value as the result."""
+        assert safe_run("1 + 2")['result'] == 3
+        assert safe_run("x = 1 + 2")['result'] is None
+        assert safe_run("result = 5\nresult * 2")['result'] == 5
+    
+    def test_safe_run_expression_error(self):
+        """Test that errors in a single expression are still decoded."""
+        result = safe_run("1 / 0", filename="expr.py")
+        
+        assert result['success'] is False
+        assert result['error_type'] == 'ZeroDivisionError'
+        assert result['file_name'] == 'expr.py'
+        assert result['line_number'] == 1
+    
+    def test_safe_run_without_capture(self, capsys):
+        """Test that capture_output=False lets prints reach stdout."""
+        result = safe_run("print('direct')", capture_output=False)
+        
+        assert result['success'] is True
+        assert result['output'] == ""
+        assert 'direct' in capsys.readouterr().out
+    
     def test_safe_run_with_custom_filename(self):
         """Test safe_run with custom filename."""
         code = "x = 1 / 0"
@@ -280,6 +440,182 @@ print(x + y)
         assert 'custom_script.py' in result.get('file_name', '')
 
 
+class TestDecodeMany:
+    """Test decode_many function."""
+    
+    def test_decode_batch(self):
+        """Test that each traceback in a batch is decoded in order."""
+        texts = [
+            "KeyError: 'a'",
+            "ZeroDivisionError: division by zero",
+            "KeyError: 'a'",
+            "",
+        ]
+        
+        results = decode_many(texts)
+        
+        assert [r['error_type'] for r in results] == [
+            'KeyError', 'ZeroDivisionError', 'KeyError', 'InvalidInput'
+        ]
+        assert results[0] == results[2]
+        assert results[0] is not results[2]
+    
+    def test_decode_empty_batch(self):
+        """Test that an empty batch gives an empty list."""
+        assert decode_many([]) == []
+
+
+class TestDecodeExceptionName:
+    """Test decode_exception_name function."""
+    
+    def test_matches_decode_exception(self):
+        """Test that a name and message decode like the raised exception."""
+        try:
+            {}['missing']
+        except KeyError as e:
+            expected = decode_exception(e)
+        
+        result = decode_exception_name(
+            'KeyError', "'missing'",
+            file_name=expected['file_name'], line_number=expected['line_number']
+        )
+        
+        assert result == expected
+    
+    def test_name_only(self):
+        """Test decoding with no message or location."""
+        result = decode_exception_name('ZeroDivisionError')
+        
+        assert result['error_type'] == 'ZeroDivisionError'
+        assert result['original_message'] == ''
+        assert result['line_number'] is None
+        assert result['emoji'] == '➗'
+    
+    def test_empty_name(self):
+        """Test that an empty name is reported as invalid input."""
+        result = decode_exception_name('')
+        
+        assert result['error_type'] == 'InvalidInput'
+        assert result['success'] is False
+
+
+class TestDecodeTracebackFile:
+    """Test decode_traceback_file function."""
+    
+    def test_decode_log_file(self, tmp_path):
+        """Test decoding a traceback saved in a log file."""
+        log = tmp_path / "error.log"
+        log.write_bytes(
+            b'Traceback (most recent call last):\r\n'
+            b'  File "app.py", line 12, in <module>\r\n'
+            b'    d["missing"]\r\n'
+            b"KeyError: 'missing'\r\n"
+        )
+        
+        result = decode_traceback_file(str(log))
+        
+        assert result['error_type'] == 'KeyError'
+        assert result['original_message'] == "'missing'"
+        assert result['line_number'] == 12
+        assert result['file_name'] == 'app.py'
+    
+    def test_decode_log_with_invalid_bytes(self, tmp_path):
+        """Test that non-UTF-8 bytes in a log don't stop decoding."""
+        log = tmp_path / "error.log"
+        log.write_bytes(b'\xff\xfe garbage\nValueError: bad value\n')
+        
+        result = decode_traceback_file(str(log))
+        
+        assert result['error_type'] == 'ValueError'
+        assert result['original_message'] == 'bad value'
+    
+    def test_edited_file_is_reread(self, tmp_path):
+        """Test that changing a log file gives the new result."""
+        import os
+        log = tmp_path / "error.log"
+        log.write_text("KeyError: 'a'\n")
+        assert decode_traceback_file(str(log))['error_type'] == 'KeyError'
+        
+        log.write_text("IndexError: list index out of range\n")
+        stat = os.stat(log)
+        os.utime(log, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert decode_traceback_file(str(log))['error_type'] == 'IndexError'
+    
+    def test_large_log_uses_last_traceback(self, tmp_path):
+        """Test that a large log is decoded from its last traceback."""
+        log = tmp_path / "big.log"
+        noise = b"INFO all good\n" * 20000
+        log.write_bytes(
+            b'Traceback (most recent call last):\n'
+            b'  File "old.py", line 1, in <module>\n'
+            b"KeyError: 'old'\n"
+            + noise +
+            b'Traceback (most recent call last):\n'
+            b'  File "new.py", line 42, in <module>\n'
+            b'    1/0\n'
+            b'ZeroDivisionError: division by zero\n'
+        )
+        
+        result = decode_traceback_file(str(log))
+        
+        assert result['error_type'] == 'ZeroDivisionError'
+        assert result['file_name'] == 'new.py'
+        assert result['line_number'] == 42
+    
+    def test_large_log_without_traceback_header(self, tmp_path):
+        """Test that a large log with no traceback header is read whole."""
+        log = tmp_path / "big.log"
+        log.write_bytes(b"INFO all good\n" * 20000 + b"ValueError: bad value\n")
+        
+        result = decode_traceback_file(str(log))
+        
+        assert result['error_type'] == 'ValueError'
+    
+    def test_headerless_log_is_read_once(self, monkeypatch):
+        """Test that scanning back through a log with no header reads each byte once."""
+        import io
+        import pydefine.core
+        
+        class CountingFile(io.BytesIO):
+            def __init__(self, data):
+                super().__init__(data)
+                self.reads = 0
+                self.bytes_read = 0
+            
+            def read(self, size=-1):
+                data = super().read(size)
+                self.reads += 1
+                self.bytes_read += len(data)
+                return data
+        
+        monkeypatch.setattr(pydefine.core, "_TAIL_CHUNK", 32)
+        data = b"INFO all good\n" * 5000 + b"ValueError: bad value\n"
+        f = CountingFile(data)
+        
+        assert pydefine.core._read_last_traceback(f, len(data)) == data
+        assert f.bytes_read == len(data)
+        assert f.reads == -(-len(data) // 32)
+    
+    def test_large_log_is_not_cached(self, tmp_path):
+        """Test that large log files are read without being cached."""
+        from pydefine.core import _read_traceback_file
+        log = tmp_path / "big.log"
+        log.write_bytes(b"INFO all good\n" * 20000 + b"ValueError: bad value\n")
+        
+        size = _read_traceback_file.cache_info().currsize
+        result = decode_traceback_file(str(log))
+        
+        assert result['error_type'] == 'ValueError'
+        assert _read_traceback_file.cache_info().currsize == size
+    
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file is reported, not raised."""
+        result = decode_traceback_file(str(tmp_path / "nope.log"))
+        
+        assert result['success'] is False
+        assert result['error_type'] == 'FileNotFoundError'
+
+
 class TestExplainFunction:
     """Test explain convenience function."""
     
@@ -344,6 +680,19 @@ class TestMultipleErrorTypes:
             assert result['error_type'] == 'ModuleNotFoundError'
             assert 'import' in result['tags']
     
+    def test_custom_subclass_uses_parent_explanation(self):
+        """Test that a user-defined subclass falls back to its parent's entry."""
+        class ConfigError(ValueError):
+            pass
+        
+        try:
+            raise ConfigError("bad setting")
+        except Exception as e:
+            result = decode_exception(e)
+            assert result['error_type'] == 'ConfigError'
+            assert 'value' in result['tags']
+            assert result['emoji'] != '❓'
+    
     def test_type_error_function_call(self):
         """Test TypeError from wrong function arguments."""
         try:
@@ -379,6 +728,107 @@ ZeroDivisionError: division by zero"""
         assert '\x1b' not in cleaned
         assert 'Traceback' in cleaned
 
+    def test_extract_without_frames(self):
+        """Test collect_frames=False finds the same innermost location."""
+        from pydefine.utils import extract_error_info
+        
+        tb = """Traceback (most recent call last):
+  File "main.py", line 5, in <module>
+    helper()
+  File "helper.py", line 2, in helper
+    return 1/0
+ZeroDivisionError: division by zero"""
+        
+        full = extract_error_info(tb)
+        fast = extract_error_info(tb, collect_frames=False)
+        
+        assert fast['frames'] == []
+        assert fast['file_name'] == full['file_name'] == 'helper.py'
+        assert fast['line_number'] == full['line_number'] == 2
+
+
+class TestPackageImports:
+    """Test the lazily loaded pydefine package namespace."""
+    
+    def test_public_names_resolve(self):
+        """Test that every name in __all__ can be looked up on the package."""
+        import pydefine
+        
+        for name in pydefine.__all__:
+            assert getattr(pydefine, name) is not None
+    
+    def test_submodules_are_attributes(self):
+        """Test that submodules are reachable as attributes in a fresh interpreter."""
+        import subprocess
+        from pathlib import Path
+        code = "import pydefine; print(pydefine.core.__name__, pydefine.mapping.__name__, pydefine.i18n.__name__)"
+        
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parents[1]
+        ).stdout
+        
+        assert out.split() == ['pydefine.core', 'pydefine.mapping', 'pydefine.i18n']
+
+
+class TestTranslation:
+    """Test Hinglish translation of explanations."""
+    
+    def test_phrases_replaced(self):
+        """Test that known phrases are translated, longest first."""
+        from pydefine.i18n import translate_explanation
+        
+        text = "You tried to open a file that doesn't exist. Check the path."
+        assert translate_explanation(text, 'hi') == (
+            "Aapne koshish ki to open ek file that exist nahi karta. Check karein the path."
+        )
+    
+    def test_english_unchanged(self):
+        """Test that English and unknown languages return the text as-is."""
+        from pydefine.i18n import translate_explanation
+        
+        text = "You tried to divide by zero"
+        assert translate_explanation(text, 'en') == text
+        assert translate_explanation(text, 'xx') == text
+    
+    def test_translation_cache(self):
+        """Test that repeated translations are served from the cache."""
+        from pydefine.i18n import translate_explanation, clear_translation_cache
+        from pydefine.i18n import _translate_to_hinglish
+        
+        clear_translation_cache()
+        first = translate_explanation("Make sure the file exists", 'hi')
+        second = translate_explanation("Make sure the file exists", 'hi')
+        
+        assert first == second == "Pakka karein the file exists"
+        assert _translate_to_hinglish.cache_info().hits == 1
+        clear_translation_cache()
+        assert _translate_to_hinglish.cache_info().currsize == 0
+    
+    def test_unsupported_language_logs_warning(self, caplog, capsys):
+        """Test that an unsupported language is reported through logging."""
+        from pydefine.i18n import set_language, get_language
+        
+        assert set_language('fr') is False
+        assert get_language() == 'en'
+        assert "'fr' not supported" in caplog.text
+        assert capsys.readouterr().out == ""
+    
+    def test_decode_includes_translation(self):
+        """Test that decoding in Hinglish adds translated_explanation."""
+        from pydefine.i18n import set_language
+        
+        set_language('hi')
+        try:
+            result = decode_traceback("ZeroDivisionError: division by zero")
+        finally:
+            set_language('en')
+        
+        assert 'Aapne koshish ki' in result['translated_explanation']
+        assert 'translated_explanation' not in decode_traceback(
+            "ZeroDivisionError: division by zero"
+        )
+
 
 # Run tests if executed directly
 if __name__ == '__main__':
@@ -12,9 +12,14 @@ from pydefine.mapping import (
     get_exception_info,
     list_all_exceptions,
     search_exceptions_by_tag,
+    resolve_exception_name,
+    find_exceptions,
     EXCEPTION_MAP,
+    TAGS_INDEX,
+    CATEGORY_INDEX,
     TOTAL_EXCEPTIONS,
-    ALL_TAGS
+    ALL_TAGS,
+    ALL_TAGS_SET
 )
 
 
@@ -52,6 +57,11 @@ class TestExceptionMap:
             assert isinstance(exc_data['tags'], list), f"{exc_name} tags not a list"
             assert len(exc_data['tags']) > 0, f"{exc_name} has no tags"
     
+    def test_map_is_read_only(self):
+        """Test that the map can't be changed out from under its indexes."""
+        with pytest.raises(TypeError):
+            EXCEPTION_MAP['NewError'] = EXCEPTION_MAP['ValueError']
+    
     def test_emojis_present(self):
         """Test that all exceptions have emojis."""
         for exc_name, exc_data in EXCEPTION_MAP.items():
@@ -59,83 +69,43 @@ class TestExceptionMap:
             assert len(exc_data['emoji']) > 0
 
 
+# Common Python exceptions that must be covered, grouped by kind
+COMMON_EXCEPTIONS = [
+    # Syntax
+    'SyntaxError', 'IndentationError', 'TabError',
+    # Names
+    'NameError', 'UnboundLocalError',
+    # Types and values
+    'TypeError', 'ValueError', 'AttributeError',
+    # Lookups
+    'KeyError', 'IndexError', 'LookupError',
+    # Arithmetic
+    'ZeroDivisionError', 'OverflowError', 'ArithmeticError',
+    # Files and IO
+    'FileNotFoundError', 'FileExistsError', 'PermissionError',
+    'IsADirectoryError', 'NotADirectoryError', 'IOError', 'OSError',
+    # Imports
+    'ImportError', 'ModuleNotFoundError',
+    # Runtime
+    'RuntimeError', 'RecursionError', 'NotImplementedError',
+    # System
+    'SystemError', 'SystemExit', 'KeyboardInterrupt',
+    # Unicode
+    'UnicodeError', 'UnicodeDecodeError',
+    'UnicodeEncodeError', 'UnicodeTranslateError',
+    # Connections
+    'ConnectionError', 'BrokenPipeError', 'ConnectionAbortedError',
+    'ConnectionRefusedError', 'ConnectionResetError', 'TimeoutError',
+]
+
+
 class TestCommonExceptions:
     """Test that common Python exceptions are covered."""
     
-    def test_syntax_errors_present(self):
-        """Test syntax-related errors."""
-        syntax_errors = ['SyntaxError', 'IndentationError', 'TabError']
-        for exc in syntax_errors:
-            assert exc in EXCEPTION_MAP, f"{exc} not in map"
-    
-    def test_name_errors_present(self):
-        """Test name-related errors."""
-        name_errors = ['NameError', 'UnboundLocalError']
-        for exc in name_errors:
-            assert exc in EXCEPTION_MAP, f"{exc} not in map"
-    
-    def test_type_errors_present(self):
-        """Test type-related errors."""
-        assert 'TypeError' in EXCEPTION_MAP
-        assert 'ValueError' in EXCEPTION_MAP
-        assert 'AttributeError' in EXCEPTION_MAP
-    
-    def test_lookup_errors_present(self):
-        """Test lookup errors."""
-        lookup_errors = ['KeyError', 'IndexError', 'LookupError']
-        for exc in lookup_errors:
-            assert exc in EXCEPTION_MAP, f"{exc} not in map"
-    
-    def test_arithmetic_errors_present(self):
-        """Test arithmetic errors."""
-        arith_errors = ['ZeroDivisionError', 'OverflowError', 'ArithmeticError']
-        for exc in arith_errors:
-            assert exc in EXCEPTION_MAP, f"{exc} not in map"
-    
-    def test_file_errors_present(self):
-        """Test file/IO errors."""
-        file_errors = [
-            'FileNotFoundError', 'FileExistsError', 'PermissionError',
-            'IsADirectoryError', 'NotADirectoryError', 'IOError', 'OSError'
-        ]
-        for exc in file_errors:
-            assert exc in EXCEPTION_MAP, f"{exc} not in map"
-    
-    def test_import_errors_present(self):
-        """Test import errors."""
-        import_errors = ['ImportError', 'ModuleNotFoundError']
-        for exc in import_errors:
-            assert exc in EXCEPTION_MAP, f"{exc} not in map"
-    
-    def test_runtime_errors_present(self):
-        """Test runtime errors."""
-        runtime_errors = ['RuntimeError', 'RecursionError', 'NotImplementedError']
-        for exc in runtime_errors:
-            assert exc in EXCEPTION_MAP, f"{exc} not in map"
-    
-    def test_system_errors_present(self):
-        """Test system-related errors."""
-        system_errors = ['SystemError', 'SystemExit', 'KeyboardInterrupt']
-        for exc in system_errors:
-            assert exc in EXCEPTION_MAP, f"{exc} not in map"
-    
-    def test_unicode_errors_present(self):
-        """Test Unicode errors."""
-        unicode_errors = [
-            'UnicodeError', 'UnicodeDecodeError', 
-            'UnicodeEncodeError', 'UnicodeTranslateError'
-        ]
-        for exc in unicode_errors:
-            assert exc in EXCEPTION_MAP, f"{exc} not in map"
-    
-    def test_connection_errors_present(self):
-        """Test connection errors."""
-        conn_errors = [
-            'ConnectionError', 'BrokenPipeError', 'ConnectionAbortedError',
-            'ConnectionRefusedError', 'ConnectionResetError', 'TimeoutError'
-        ]
-        for exc in conn_errors:
-            assert exc in EXCEPTION_MAP, f"{exc} not in map"
+    @pytest.mark.parametrize("exc", COMMON_EXCEPTIONS)
+    def test_common_exception_present(self, exc):
+        """Test that each common exception has a map entry."""
+        assert exc in EXCEPTION_MAP, f"{exc} not in map"
 
 
 class TestGetExceptionInfo:
@@ -160,6 +130,16 @@ class TestGetExceptionInfo:
         assert 'unknown' in info['tags']
         assert info['emoji'] == '❓'
     
+    def test_known_exception_is_shared_entry(self):
+        """Test that known names return the map entry itself, uncopied."""
+        assert get_exception_info('KeyError') is EXCEPTION_MAP['KeyError']
+    
+    def test_unknown_exception_is_fresh_copy(self):
+        """Test that changing one fallback result doesn't affect the next."""
+        get_exception_info('UnknownCustomError')['tags'].append('mutated')
+        
+        assert 'mutated' not in get_exception_info('UnknownCustomError')['tags']
+    
     def test_get_multiple_exceptions(self):
         """Test getting info for multiple exceptions."""
         exceptions = ['NameError', 'TypeError', 'FileNotFoundError']
@@ -168,6 +148,18 @@ class TestGetExceptionInfo:
             info = get_exception_info(exc)
             assert info is not None
             assert len(info['simple_explanation']) > 0
+    
+    def test_resolve_exception_name(self):
+        """Test resolving exception classes to their closest mapped name."""
+        class CustomLookupError(KeyError):
+            pass
+        
+        class Unmapped(Exception):
+            pass
+        
+        assert resolve_exception_name(ZeroDivisionError) == 'ZeroDivisionError'
+        assert resolve_exception_name(CustomLookupError) == 'KeyError'
+        assert resolve_exception_name(Unmapped) == 'Unmapped'
 
 
 class TestListAllExceptions:
@@ -243,6 +235,60 @@ class TestSearchExceptionsByTag:
         """Test that search results are sorted."""
         results = search_exceptions_by_tag('syntax')
         assert results == sorted(results)
+    
+    def test_tags_index_matches_map(self):
+        """Test that TAGS_INDEX agrees with the tags in EXCEPTION_MAP."""
+        for exc_name, exc_data in EXCEPTION_MAP.items():
+            for tag in exc_data['tags']:
+                assert exc_name in TAGS_INDEX[tag.lower()]
+
+
+class TestFindExceptions:
+    """Test find_exceptions function."""
+    
+    def test_finds_names_in_order(self):
+        """Test that every mentioned exception is found in order."""
+        text = (
+            "Traceback (most recent call last):\n"
+            "KeyError: 'x'\n\n"
+            "During handling of the above exception, another exception occurred:\n\n"
+            "ValueError: bad value"
+        )
+        assert find_exceptions(text) == ['KeyError', 'ValueError']
+    
+    def test_whole_names_only(self):
+        """Test that names are matched whole, not as substrings."""
+        assert find_exceptions("ConnectionResetError: reset") == ['ConnectionResetError']
+        assert find_exceptions("MyValueError: custom") == []
+    
+    def test_empty_text(self):
+        """Test that empty text returns an empty list."""
+        assert find_exceptions("") == []
+
+
+class TestCategoryIndex:
+    """Test CATEGORY_INDEX constant."""
+    
+    def test_index_matches_tags(self):
+        """Test that each exception is listed under exactly its own tags."""
+        for exc_name, exc_data in EXCEPTION_MAP.items():
+            for tag in exc_data['tags']:
+                assert exc_name in CATEGORY_INDEX[tag]
+        indexed = sum(len(names) for names in CATEGORY_INDEX.values())
+        assert indexed == sum(len(d['tags']) for d in EXCEPTION_MAP.values())
+    
+    def test_common_categories(self):
+        """Test that common exceptions land in the expected category."""
+        assert 'SyntaxError' in CATEGORY_INDEX['syntax']
+        assert 'FileNotFoundError' in CATEGORY_INDEX['file']
+        assert isinstance(CATEGORY_INDEX['file'], tuple)
+    
+    def test_indexes_are_read_only(self):
+        """Test that the shared indexes can't be changed by callers."""
+        with pytest.raises(TypeError):
+            CATEGORY_INDEX['file'] = ()
+        with pytest.raises(TypeError):
+            TAGS_INDEX['file'] = ()
 
 
 class TestAllTags:
@@ -270,6 +316,12 @@ class TestAllTags:
     def test_no_duplicate_tags(self):
         """Test that there are no duplicate tags."""
         assert len(ALL_TAGS) == len(set(ALL_TAGS))
+    
+    def test_all_tags_set_matches(self):
+        """Test that ALL_TAGS_SET holds exactly the tags in ALL_TAGS."""
+        assert isinstance(ALL_TAGS_SET, frozenset)
+        assert ALL_TAGS_SET == set(ALL_TAGS)
+        assert 'syntax' in ALL_TAGS_SET
 
 
 class TestExplanationQuality: